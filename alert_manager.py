@@ -1,16 +1,66 @@
 import smtplib
+import threading
+import queue
+import asyncio
+
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
 from email.mime.text import MIMEText
+from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
 from io import BytesIO
 import base64
 from datetime import datetime
 import logging
 
 class AlertManager:
-    def __init__(self, email_config):
+    def __init__(self, email_config, enable_plots=True):
         self.email_config = email_config
+        self.enable_plots = enable_plots
         self.logger = logging.getLogger('alert_manager')
+        # One figure reused for every alert plot; creating and closing a
+        # figure per email thrashes the Agg renderer and leaks memory
+        self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        self.canvas = FigureCanvasAgg(self.fig)
+        # Persistent animated artists for blitting: the static background
+        # (axes, grid, labels, legend) is rendered once and cached, and each
+        # plot only restores it and redraws these three artists on top
+        self._price_line, = self.ax.plot([], [], label='Close Price',
+                                         color='blue', alpha=0.6, animated=True)
+        self._mean_line, = self.ax.plot([], [], label='Moving Mean',
+                                        color='green', linestyle='--', alpha=0.7,
+                                        animated=True)
+        self._anom_line, = self.ax.plot([], [], linestyle='', marker='o',
+                                        color='red', label='Anomaly', zorder=5,
+                                        animated=True)
+        self.ax.set_xlabel('Time')
+        self.ax.set_ylabel('Price ($)')
+        self.ax.legend()
+        self.ax.grid(True)
+        self.ax.tick_params(axis='x', rotation=45)
+        self._bg = None
+        self._bg_ticker = None
+        self._bg_limits = None
+        # One PNG buffer reused for every encode instead of a fresh
+        # BytesIO allocation per alert
+        self._png_buf = BytesIO()
+        # Emails are sent by a background worker over one persistent SMTP
+        # connection so the monitoring loop never blocks on a TLS handshake
+        self._queue = queue.Queue()
+        self._smtp = None
+        self._worker = threading.Thread(target=self._smtp_worker, daemon=True)
+        self._worker.start()
+        # Async sending path; the lock serializes use of the shared figure
+        # and the persistent aiosmtplib connection across gathered tasks
+        self._async_smtp = None
+        self._async_lock = asyncio.Lock()
 
     def generate_alert_message(self, ticker, anomaly_data):
         """Generate formatted alert message"""
@@ -24,77 +74,185 @@ class AlertManager:
             f"Possible unusual activity detected!"
         )
 
+    def _downsample_minmax(self, times, values, n_bins):
+        """
+        Reduce a long series to interleaved per-bin (min, max) pairs so the
+        plotted point count stays O(bins) while peaks and troughs survive
+        """
+        n = len(values)
+        starts = (np.arange(n_bins) * n) // n_bins
+        mins = np.minimum.reduceat(values, starts)
+        maxs = np.maximum.reduceat(values, starts)
+
+        out_t = np.repeat(times[starts], 2)
+        out_v = np.empty(2 * n_bins, dtype=values.dtype)
+        out_v[0::2] = mins
+        out_v[1::2] = maxs
+        return out_t, out_v
+
     def create_plot(self, ticker, history):
         """Create plot of stock prices with anomalies"""
-        plt.figure(figsize=(12, 6))
-        plt.plot(history['Time'], history['Close'], label='Close Price', color='blue', alpha=0.6)
-        
-        if 'Mean' in history.columns:
-            plt.plot(history['Time'], history['Mean'], label='Moving Mean', 
-                    color='green', linestyle='--', alpha=0.7)
-        
-        anomalies = history[history['Anomaly']]
-        if not anomalies.empty:
-            plt.scatter(anomalies['Time'], anomalies['Close'], 
-                        color='red', label='Anomaly', zorder=5)
-        
-        plt.title(f'Stock Price Anomalies for {ticker}')
-        plt.xlabel('Time')
-        plt.ylabel('Price ($)')
-        plt.legend()
-        plt.grid(True)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
-        # Save plot to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png')
-        buffer.seek(0)
-        plt.close()
-        return buffer
+        ax = self.ax
+        times = np.asarray(history['Time'])
+        closes = np.asarray(history['Close'])
+
+        # Artists created empty never pass through unit handling, so
+        # register the date converter or the x-axis shows raw day floats
+        ax.xaxis.update_units(times)
+
+        # Cap the plotted points at roughly one min/max pair per pixel
+        # column; anomaly markers below come from the unreduced arrays
+        width_px = int(self.fig.get_figwidth() * self.fig.dpi)
+        downsample = len(closes) > 2 * width_px
+
+        if downsample:
+            self._price_line.set_data(*self._downsample_minmax(times, closes, width_px))
+        else:
+            self._price_line.set_data(times, closes)
+
+        if 'Mean' in history:
+            means = np.asarray(history['Mean'])
+            if downsample:
+                self._mean_line.set_data(*self._downsample_minmax(times, means, width_px))
+            else:
+                self._mean_line.set_data(times, means)
+        else:
+            self._mean_line.set_data([], [])
+
+        mask = np.asarray(history['Anomaly'], dtype=bool)
+        self._anom_line.set_data(times[mask], closes[mask])
+
+        ax.relim()
+        ax.autoscale_view()
+        limits = (ax.get_xlim(), ax.get_ylim())
+
+        # Re-render the static background only when it actually changed;
+        # otherwise restore the cached pixels and blit just the line artists
+        if self._bg is None or ticker != self._bg_ticker or limits != self._bg_limits:
+            ax.set_title(f'Stock Price Anomalies for {ticker}')
+            self.fig.tight_layout()
+            self.canvas.draw()
+            self._bg = self.canvas.copy_from_bbox(ax.bbox)
+            self._bg_ticker = ticker
+            self._bg_limits = limits
+
+        self.canvas.restore_region(self._bg)
+        ax.draw_artist(self._price_line)
+        ax.draw_artist(self._mean_line)
+        ax.draw_artist(self._anom_line)
+        self.canvas.blit(ax.bbox)
+        image = Image.frombuffer('RGBA', self.canvas.get_width_height(),
+                                 self.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        self._png_buf.seek(0)
+        self._png_buf.truncate()
+        image.save(self._png_buf, 'PNG', optimize=False)
+        return self._png_buf.getvalue()
 
     def send_email_alert(self, ticker, anomaly_data, history):
-        """Send email alert with plot attachment"""
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_config['SMTP_USER']
-            msg['To'] = ", ".join(self.email_config['ALERT_EMAILS'])
-            msg['Subject'] = f"Stock Anomaly Alert: {ticker}"
-            
-            # Create text and HTML versions
-            text = self.generate_alert_message(ticker, anomaly_data)
-            html = f"""\
-            <html>
-              <body>
-                <p>{text.replace('\n', '<br>')}</p>
-                <img src="cid:plot" alt="Stock Chart">
-              </body>
-            </html>
-            """
-            
-            # Attach text version
-            msg.attach(MIMEText(text, 'plain'))
-            
-            # Attach HTML version
-            part = MIMEText(html, 'html')
-            msg.attach(part)
-            
-            # Attach plot image
-            plot_buffer = self.create_plot(ticker, history)
-            image = MIMEText(plot_buffer.read(), 'base64', 'png')
+        """Queue an email alert for the background SMTP worker"""
+        self._queue.put_nowait((ticker, anomaly_data, history))
+
+    def _build_message(self, ticker, anomaly_data, history):
+        """Build the MIME message with plot attachment"""
+        msg = MIMEMultipart()
+        msg['From'] = self.email_config['SMTP_USER']
+        msg['To'] = ", ".join(self.email_config['ALERT_EMAILS'])
+        msg['Subject'] = f"Stock Anomaly Alert: {ticker}"
+
+        # Create text and HTML versions
+        text = self.generate_alert_message(ticker, anomaly_data)
+        text_html = text.replace('\n', '<br>')
+        img_tag = '<img src="cid:plot" alt="Stock Chart">' if self.enable_plots else ''
+        html = f"""\
+        <html>
+          <body>
+            <p>{text_html}</p>
+            {img_tag}
+          </body>
+        </html>
+        """
+
+        # Attach text version
+        msg.attach(MIMEText(text, 'plain'))
+
+        # Attach HTML version
+        part = MIMEText(html, 'html')
+        msg.attach(part)
+
+        # Attach plot image unless plotting is disabled
+        if self.enable_plots:
+            image = MIMEImage(self.create_plot(ticker, history), 'png')
             image.add_header('Content-ID', '<plot>')
             image.add_header('Content-Disposition', 'inline', filename='plot.png')
             msg.attach(image)
-            
-            # Send email
-            with smtplib.SMTP(self.email_config['SMTP_SERVER'], self.email_config['SMTP_PORT']) as server:
-                server.starttls()
-                server.login(self.email_config['SMTP_USER'], self.email_config['SMTP_PASSWORD'])
-                server.send_message(msg)
-                
-            self.logger.info(f"Email alert sent for {ticker}")
-        except Exception as e:
-            self.logger.error(f"Failed to send email alert: {e}")
+
+        return msg
+
+    async def send_email_alert_async(self, ticker, anomaly_data, history):
+        """Send email alert without blocking the event loop"""
+        if not AIOSMTPLIB_AVAILABLE:
+            # Fall back to the threaded queue worker
+            self.send_email_alert(ticker, anomaly_data, history)
+            return
+
+        async with self._async_lock:
+            try:
+                msg = await asyncio.to_thread(self._build_message, ticker, anomaly_data, history)
+                if self._async_smtp is None:
+                    self._async_smtp = await self._connect_async()
+                try:
+                    await self._async_smtp.send_message(msg)
+                except aiosmtplib.errors.SMTPException:
+                    # Stale connection; reconnect and retry once
+                    self._async_smtp = await self._connect_async()
+                    await self._async_smtp.send_message(msg)
+                self.logger.info(f"Email alert sent for {ticker}")
+            except Exception as e:
+                self.logger.error(f"Failed to send email alert: {e}")
+
+    async def _connect_async(self):
+        """Open and authenticate the persistent aiosmtplib connection"""
+        server = aiosmtplib.SMTP(hostname=self.email_config['SMTP_SERVER'],
+                                 port=self.email_config['SMTP_PORT'],
+                                 start_tls=True)
+        await server.connect()
+        await server.login(self.email_config['SMTP_USER'], self.email_config['SMTP_PASSWORD'])
+        return server
+
+    def _connect(self):
+        """Open and authenticate the persistent SMTP connection"""
+        server = smtplib.SMTP(self.email_config['SMTP_SERVER'], self.email_config['SMTP_PORT'])
+        server.starttls()
+        server.login(self.email_config['SMTP_USER'], self.email_config['SMTP_PASSWORD'])
+        return server
+
+    def _smtp_worker(self):
+        """Drain queued alerts and send them over one reused connection"""
+        while True:
+            batch = [self._queue.get()]
+            # Coalesce anything else already waiting onto this connection
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for ticker, anomaly_data, history in batch:
+                try:
+                    msg = self._build_message(ticker, anomaly_data, history)
+                    if self._smtp is None:
+                        self._smtp = self._connect()
+                    try:
+                        self._smtp.send_message(msg)
+                    except smtplib.SMTPException:
+                        # Stale connection; reconnect and retry once
+                        self._smtp = self._connect()
+                        self._smtp.send_message(msg)
+                    self.logger.info(f"Email alert sent for {ticker}")
+                except Exception as e:
+                    self.logger.error(f"Failed to send email alert: {e}")
+                finally:
+                    self._queue.task_done()
 
     def console_alert(self, ticker, anomaly_data):
         """Print alert to console"""
@@ -1,59 +1,294 @@
+import collections
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.seasonal import seasonal_decompose
 from sklearn.ensemble import IsolationForest
 from typing import Tuple, Optional
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _rolling_meanstd_numpy(prices: np.ndarray, W: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean/std over a trailing window via cumulative sums"""
+    means = np.zeros(len(prices))
+    stds = np.zeros(len(prices))
+    c = np.concatenate(([0.0], np.cumsum(prices)))
+    c2 = np.concatenate(([0.0], np.cumsum(prices ** 2)))
+    means[W:] = (c[W:-1] - c[:-W-1]) / W
+    vars_ = (c2[W:-1] - c2[:-W-1]) / W - means[W:] ** 2
+    stds[W:] = np.sqrt(np.maximum(vars_, 0))
+    return means, stds
+
+
+def _rolling_meanstd_incremental(prices: np.ndarray, W: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean/std maintained incrementally, one add and one subtract per
+    step. Unlike whole-series cumulative sums, the running totals never grow
+    beyond one window's worth of magnitude, which avoids catastrophic
+    cancellation on long series with large absolute prices.
+    """
+    n = len(prices)
+    means = np.zeros(n)
+    stds = np.zeros(n)
+    if n <= W:
+        return means, stds
+
+    sum_ = 0.0
+    sum2 = 0.0
+    for j in range(W):
+        sum_ += prices[j]
+        sum2 += prices[j] * prices[j]
+
+    for i in range(W, n):
+        # Stats for index i come from the trailing window [i-W, i)
+        mean = sum_ / W
+        var = sum2 / W - mean * mean
+        means[i] = mean
+        stds[i] = np.sqrt(max(var, 0.0))
+        sum_ += prices[i] - prices[i - W]
+        sum2 += prices[i] * prices[i] - prices[i - W] * prices[i - W]
+    return means, stds
+
+
+def _detect_batch_kernel(prices_2d, lens, W, threshold, out_anom, out_mean, out_std):
+    """
+    Z-score detection over a padded 2D batch of price series, one row per
+    ticker; rows are independent so the outer loop parallelizes cleanly
+    """
+    for t in prange(prices_2d.shape[0]):
+        n = lens[t]
+        if n <= W:
+            continue
+
+        sum_ = 0.0
+        sum2 = 0.0
+        for j in range(W):
+            p = prices_2d[t, j]
+            sum_ += p
+            sum2 += p * p
+
+        for i in range(W, n):
+            mean = sum_ / W
+            var = sum2 / W - mean * mean
+            if var < 0.0:
+                var = 0.0
+            std = var ** 0.5
+            out_mean[t, i] = mean
+            out_std[t, i] = std
+
+            p = prices_2d[t, i]
+            z = (p - mean) / std if std > 0.0 else 0.0
+            out_anom[t, i] = abs(z) > threshold
+
+            old = prices_2d[t, i - W]
+            sum_ += p - old
+            sum2 += p * p - old * old
+
+
+if NUMBA_AVAILABLE:
+    rolling_meanstd = njit(cache=True)(_rolling_meanstd_incremental)
+    detect_batch_kernel = njit(parallel=True, cache=True)(_detect_batch_kernel)
+else:
+    rolling_meanstd = _rolling_meanstd_numpy
+    detect_batch_kernel = _detect_batch_kernel
+
+
 class AnomalyDetector:
-    def __init__(self, window_size=20, threshold=3.0):
+    def __init__(self, window_size=20, threshold=3.0, refit_every=50, max_train=500):
         self.window_size = window_size
         self.threshold = threshold
-        self.models = {}  # To store trained models per stock
+        self.refit_every = refit_every  # Refit after this many detection calls
+        self.max_train = max_train  # Train on at most this many recent points
+        self.models = {}  # ticker -> (model, n_points_at_fit, calls_since_fit)
+        self._rolling = {}  # ticker -> rolling window state for detect_incremental
+        self._series_cache = {}  # ticker -> cached full-series rolling stats
 
     def z_score_detection(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Detect anomalies using moving Z-score method
+        Detect anomalies using moving Z-score method (vectorized)
         """
-        anomalies = np.zeros_like(prices)
-        means = np.zeros_like(prices)
-        stds = np.zeros_like(prices)
-        
-        for i in range(self.window_size, len(prices)):
-            window = prices[i-self.window_size:i]
-            mean = np.mean(window)
-            std = np.std(window)
-            
-            if std == 0:
-                z_score = 0
-            else:
-                z_score = (prices[i] - mean) / std
-                
-            means[i] = mean
-            stds[i] = std
-            anomalies[i] = abs(z_score) > self.threshold
-            
+        anomalies = np.zeros(len(prices), dtype=bool)
+
+        W = self.window_size
+        if len(prices) <= W:
+            return anomalies, np.zeros(len(prices)), np.zeros(len(prices))
+
+        means, stds = rolling_meanstd(np.ascontiguousarray(prices, dtype=np.float64), W)
+
+        z = np.where(stds[W:] > 0, (prices[W:] - means[W:]) / np.where(stds[W:] > 0, stds[W:], 1), 0)
+        anomalies[W:] = np.abs(z) > self.threshold
+
         return anomalies, means, stds
 
-    def isolation_forest_detection(self, prices: np.ndarray) -> np.ndarray:
+    def isolation_forest_detection(self, prices: np.ndarray, ticker: str) -> np.ndarray:
         """
-        Detect anomalies using Isolation Forest
+        Detect anomalies using Isolation Forest, with one cached model per ticker
         """
         if len(prices) < self.window_size * 2:
-            return np.zeros_like(prices)
-            
+            return np.zeros(len(prices), dtype=bool)
+
         # Reshape for sklearn
         X = prices.reshape(-1, 1)
-        
-        # Train or retrieve model
-        model_key = tuple(prices[:self.window_size])
-        if model_key not in self.models:
-            self.models[model_key] = IsolationForest(contamination=0.05)
-            self.models[model_key].fit(X[:self.window_size])
-            
-        preds = self.models[model_key].predict(X)
-        return (preds == -1).astype(int)
 
-    def detect(self, data: pd.DataFrame, method: str = 'zscore') -> Optional[pd.DataFrame]:
+        # Reuse the cached model, refitting after refit_every calls. The
+        # series length can't drive this: a 1d/5m fetch caps out around 78
+        # bars and resets each session, so a length delta would never grow
+        cached = self.models.get(ticker)
+        if cached is not None:
+            model, n_at_fit, calls = cached
+            calls += 1
+            if calls >= self.refit_every or len(prices) < n_at_fit:
+                # Due for a refit, or the series shrank (new session)
+                cached = None
+            else:
+                self.models[ticker] = (model, n_at_fit, calls)
+
+        if cached is None:
+            model = IsolationForest(contamination=0.05)
+            model.fit(X[-self.max_train:])
+            self.models[ticker] = (model, len(prices), 0)
+
+        preds = model.predict(X)
+        return preds == -1
+
+    def _zscore_cached(self, prices: np.ndarray, timestamps, ticker: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Full-series z-score detection with per-ticker memoized rolling
+        stats: when the incoming series is a superset of the cached one,
+        only the new suffix of means/stds is computed and appended
+        """
+        W = self.window_size
+        cache = self._series_cache.get(ticker)
+
+        if (cache is not None and len(prices) >= cache['n']
+                and timestamps[0] == cache['t_start']
+                and timestamps[cache['n'] - 1] == cache['t_end']):
+            n_old = cache['n']
+            if len(prices) == n_old:
+                means, stds = cache['means'], cache['stds']
+            else:
+                # Recompute from W bars back so the suffix windows are full
+                tail_start = max(n_old - W, 0)
+                tail = np.ascontiguousarray(prices[tail_start:], dtype=np.float64)
+                tail_means, tail_stds = rolling_meanstd(tail, W)
+                means = np.concatenate([cache['means'], tail_means[n_old - tail_start:]])
+                stds = np.concatenate([cache['stds'], tail_stds[n_old - tail_start:]])
+        else:
+            # No overlap (e.g. market-open boundary); start the cache over
+            means, stds = rolling_meanstd(
+                np.ascontiguousarray(prices, dtype=np.float64), W)
+
+        self._series_cache[ticker] = {
+            't_start': timestamps[0], 't_end': timestamps[-1],
+            'n': len(prices), 'means': means, 'stds': stds
+        }
+
+        anomalies = np.zeros(len(prices), dtype=bool)
+        if len(prices) > W:
+            z = np.where(stds[W:] > 0,
+                         (prices[W:] - means[W:]) / np.where(stds[W:] > 0, stds[W:], 1), 0)
+            anomalies[W:] = np.abs(z) > self.threshold
+        return anomalies, means, stds
+
+    def detect_batch(self, prices_by_ticker: dict) -> dict:
+        """
+        Z-score detection for all tickers in one pass; when numba is
+        available the per-ticker rows run in parallel with prange.
+        Returns {ticker: (anomalies, means, stds)} with arrays trimmed
+        back to each series' own length
+        """
+        tickers = list(prices_by_ticker)
+        if not tickers:
+            return {}
+
+        lens = np.array([len(prices_by_ticker[t]) for t in tickers], dtype=np.int64)
+        n_max = int(lens.max())
+        prices_2d = np.zeros((len(tickers), n_max))
+        for row, ticker in enumerate(tickers):
+            prices_2d[row, :lens[row]] = np.asarray(prices_by_ticker[ticker], dtype=np.float64)
+
+        out_anom = np.zeros((len(tickers), n_max), dtype=np.bool_)
+        out_mean = np.zeros((len(tickers), n_max))
+        out_std = np.zeros((len(tickers), n_max))
+        detect_batch_kernel(prices_2d, lens, self.window_size, self.threshold,
+                            out_anom, out_mean, out_std)
+
+        return {
+            ticker: (out_anom[row, :lens[row]], out_mean[row, :lens[row]],
+                     out_std[row, :lens[row]])
+            for row, ticker in enumerate(tickers)
+        }
+
+    def detect_incremental(self, data: pd.DataFrame, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        Z-score detection over only the bars newer than the last seen
+        timestamp for this ticker, maintaining the rolling window and its
+        sums incrementally so each new bar costs O(1)
+        """
+        if len(data) < self.window_size:
+            return None
+
+        prices = data['Close'].values
+        timestamps = data.index
+        W = self.window_size
+
+        state = self._rolling.get(ticker)
+        if state is not None and state['t_end'] is not None and len(timestamps) > 0:
+            if timestamps[0] > state['t_end']:
+                # Gap in the series (e.g. new session); rebuild from scratch
+                state = None
+            else:
+                new_mask = np.asarray(timestamps > state['t_end'])
+                prices = prices[new_mask]
+                timestamps = timestamps[new_mask]
+
+        if state is None:
+            state = {'closes': collections.deque(maxlen=W), 'sum': 0.0,
+                     'sqsum': 0.0, 't_end': None}
+            self._rolling[ticker] = state
+
+        closes = state['closes']
+        sum_ = state['sum']
+        sqsum = state['sqsum']
+        hits = {'Time': [], 'Close': [], 'Mean': [], 'Std': []}
+
+        for t, price in zip(timestamps, prices):
+            if len(closes) == W:
+                mean = sum_ / W
+                std = np.sqrt(max(sqsum / W - mean * mean, 0.0))
+                z = 0.0 if std == 0 else (price - mean) / std
+                if abs(z) > self.threshold:
+                    hits['Time'].append(t)
+                    hits['Close'].append(price)
+                    hits['Mean'].append(mean)
+                    hits['Std'].append(std)
+                evicted = closes[0]
+                sum_ -= evicted
+                sqsum -= evicted * evicted
+            closes.append(price)
+            sum_ += price
+            sqsum += price * price
+
+        state['sum'] = sum_
+        state['sqsum'] = sqsum
+        if len(timestamps) > 0:
+            state['t_end'] = timestamps[-1]
+
+        return pd.DataFrame({
+            'Time': hits['Time'],
+            'Close': hits['Close'],
+            'Mean': hits['Mean'],
+            'Std': hits['Std'],
+            'Method': 'zscore',
+            'Anomaly': True
+        })
+
+    def detect(self, data: pd.DataFrame, method: str = 'zscore', ticker: str = None) -> Optional[pd.DataFrame]:
         """
         Detect anomalies in stock data
         """
@@ -64,24 +299,24 @@ class AnomalyDetector:
         timestamps = data.index
         
         if method == 'zscore':
-            anomalies, means, stds = self.z_score_detection(prices)
+            if ticker is not None:
+                anomalies, means, stds = self._zscore_cached(prices, timestamps, ticker)
+            else:
+                anomalies, means, stds = self.z_score_detection(prices)
         elif method == 'isolation':
-            anomalies = self.isolation_forest_detection(prices)
-            means = np.zeros_like(prices)
-            stds = np.zeros_like(prices)
+            anomalies = self.isolation_forest_detection(prices, ticker)
+            means = stds = None
         else:
             raise ValueError(f"Unknown method: {method}")
-            
-        results = []
-        for i in range(len(prices)):
-            if anomalies[i]:
-                results.append({
-                    'Time': timestamps[i],
-                    'Close': prices[i],
-                    'Mean': means[i] if method == 'zscore' else np.nan,
-                    'Std': stds[i] if method == 'zscore' else np.nan,
-                    'Method': method,
-                    'Anomaly': True
-                })
-                
-        return pd.DataFrame(results)
\ No newline at end of file
+
+        # Build the result frame from one boolean mask instead of a row loop
+        mask = anomalies
+        n_hits = int(mask.sum())
+        return pd.DataFrame({
+            'Time': timestamps[mask],
+            'Close': prices[mask],
+            'Mean': means[mask] if means is not None else np.full(n_hits, np.nan),
+            'Std': stds[mask] if stds is not None else np.full(n_hits, np.nan),
+            'Method': method,
+            'Anomaly': True
+        })
\ No newline at end of file
@@ -1,31 +1,42 @@
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
-import time
 
 class DataFetcher:
-    def __init__(self):
-        self.last_fetch_time = {}
-
     def fetch_stock_data(self, ticker, period='1d', interval='5m'):
         """
-        Fetch stock data from Yahoo Finance API with rate limiting
+        Fetch stock data for a single ticker from Yahoo Finance API
         """
-        # Implement basic rate limiting
-        if ticker in self.last_fetch_time:
-            elapsed = time.time() - self.last_fetch_time[ticker]
-            if elapsed < 2:  # 2 seconds between requests
-                time.sleep(2 - elapsed)
-        
         try:
             stock = yf.Ticker(ticker)
             data = stock.history(period=period, interval=interval)
-            self.last_fetch_time[ticker] = time.time()
             return data[['Close']].dropna()
         except Exception as e:
             print(f"Error fetching data for {ticker}: {e}")
             return None
 
+    def fetch_bulk(self, tickers, period='1d', interval='5m'):
+        """
+        Fetch data for all tickers in one batched request
+        """
+        try:
+            data = yf.download(tickers, period=period, interval=interval,
+                               group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            print(f"Error fetching bulk data for {tickers}: {e}")
+            return {}
+
+        results = {}
+        for ticker in tickers:
+            try:
+                # group_by='ticker' keeps a (Ticker, Price) column MultiIndex
+                # even for a single symbol, so branch on the columns themselves
+                frame = data[ticker] if isinstance(data.columns, pd.MultiIndex) else data
+                results[ticker] = frame[['Close']].dropna()
+            except KeyError:
+                print(f"No data returned for {ticker}")
+        return results
+
     def validate_data(self, data, ticker):
         """
         Validate the fetched data
@@ -1,7 +1,8 @@
-import time
+import asyncio
 from datetime import datetime
 import logging
 from typing import Dict
+import numpy as np
 import pandas as pd
 from data_fetcher import DataFetcher
 from anomaly_detector import AnomalyDetector
@@ -18,6 +19,63 @@ logging.basicConfig(
     ]
 )
 
+class HistoryBuffer:
+    """
+    Struct-of-arrays store for per-ticker detection history: preallocated
+    numpy columns with a length cursor, grown by doubling, so appends never
+    copy the accumulated history and consumers get zero-copy views
+    """
+    def __init__(self, cap=1024):
+        self.cap = cap
+        self.n = 0
+        self.time = np.empty(cap, dtype='datetime64[ns]')
+        self.close = np.empty(cap)
+        self.mean = np.empty(cap)
+        self.std = np.empty(cap)
+        self.anomaly = np.empty(cap, dtype=bool)
+        self._seen = set()
+
+    def __len__(self):
+        return self.n
+
+    def append(self, rows: pd.DataFrame):
+        """Append result rows, skipping timestamps already recorded"""
+        fresh = rows[~rows['Time'].isin(self._seen)]
+        k = len(fresh)
+        if k == 0:
+            return
+
+        while self.n + k > self.cap:
+            self.cap *= 2
+            self.time = np.resize(self.time, self.cap)
+            self.close = np.resize(self.close, self.cap)
+            self.mean = np.resize(self.mean, self.cap)
+            self.std = np.resize(self.std, self.cap)
+            self.anomaly = np.resize(self.anomaly, self.cap)
+
+        sl = slice(self.n, self.n + k)
+        times = pd.DatetimeIndex(fresh['Time'])
+        if times.tz is not None:
+            times = times.tz_localize(None)
+        self.time[sl] = times.values
+        self.close[sl] = fresh['Close'].values
+        self.mean[sl] = fresh['Mean'].values
+        self.std[sl] = fresh['Std'].values
+        self.anomaly[sl] = fresh['Anomaly'].values
+        self.n += k
+        self._seen.update(fresh['Time'])
+
+    def as_view(self):
+        """Zero-copy column views over the filled prefix"""
+        return {
+            'Time': self.time[:self.n],
+            'Close': self.close[:self.n],
+            'Mean': self.mean[:self.n],
+            'Std': self.std[:self.n],
+            'Anomaly': self.anomaly[:self.n]
+        }
+
+
 class StockMonitor:
     def __init__(self):
         self.data_fetcher = DataFetcher()
@@ -32,60 +90,64 @@ class StockMonitor:
             'SMTP_USER': SMTP_USER,
             'SMTP_PASSWORD': SMTP_PASSWORD
         })
-        self.history: Dict[str, pd.DataFrame] = {
-            ticker: pd.DataFrame(columns=['Time', 'Close', 'Mean', 'Std', 'Method', 'Anomaly'])
-            for ticker in STOCKS_TO_MONITOR
+        self.history: Dict[str, HistoryBuffer] = {
+            ticker: HistoryBuffer() for ticker in STOCKS_TO_MONITOR
         }
         self.logger = logging.getLogger('stock_monitor')
 
     def update_history(self, ticker: str, new_data: pd.DataFrame):
         """Update historical data for a stock"""
         if new_data is not None and not new_data.empty:
-            self.history[ticker] = pd.concat(
-                [self.history[ticker], new_data],
-                ignore_index=True
-            ).drop_duplicates(subset=['Time'])
+            self.history[ticker].append(new_data)
 
-    def monitor(self):
+    def get_history(self, ticker: str) -> dict:
+        """Column views over the accumulated history for a stock"""
+        return self.history[ticker].as_view()
+
+    async def process_ticker(self, ticker: str, data: pd.DataFrame):
+        """Run detection and alerting for one ticker"""
+        try:
+            # Validate data
+            if not self.data_fetcher.validate_data(data, ticker):
+                return
+
+            # Detect anomalies using multiple methods; the z-score path only
+            # processes bars it has not seen yet
+            zscore_results = self.detector.detect_incremental(data, ticker)
+            isolation_results = self.detector.detect(data, method='isolation', ticker=ticker)
+
+            # Update history
+            self.update_history(ticker, zscore_results)
+            self.update_history(ticker, isolation_results)
+
+            # Process alerts
+            for results in (zscore_results, isolation_results):
+                if results is not None and not results.empty:
+                    latest = results.iloc[-1]
+                    self.alert_manager.console_alert(ticker, latest)
+                    await self.alert_manager.send_email_alert_async(
+                        ticker, latest, self.get_history(ticker))
+
+        except Exception as e:
+            self.logger.error(f"Error processing {ticker}: {e}")
+
+    async def monitor(self):
         """Main monitoring loop"""
         self.logger.info(f"Starting monitoring for stocks: {', '.join(STOCKS_TO_MONITOR)}")
         self.logger.info(f"Check interval: {CHECK_INTERVAL} seconds")
-        
+
         try:
             while True:
-                for ticker in STOCKS_TO_MONITOR:
-                    try:
-                        # Fetch and validate data
-                        data = self.data_fetcher.fetch_stock_data(ticker)
-                        if not self.data_fetcher.validate_data(data, ticker):
-                            continue
-                            
-                        # Detect anomalies using multiple methods
-                        zscore_results = self.detector.detect(data, method='zscore')
-                        isolation_results = self.detector.detect(data, method='isolation')
-                        
-                        # Update history
-                        self.update_history(ticker, zscore_results)
-                        self.update_history(ticker, isolation_results)
-                        
-                        # Process alerts
-                        if zscore_results is not None and not zscore_results.empty:
-                            latest = zscore_results.iloc[-1]
-                            self.alert_manager.console_alert(ticker, latest)
-                            self.alert_manager.send_email_alert(ticker, latest, self.history[ticker])
-                            
-                        if isolation_results is not None and not isolation_results.empty:
-                            latest = isolation_results.iloc[-1]
-                            self.alert_manager.console_alert(ticker, latest)
-                            self.alert_manager.send_email_alert(ticker, latest, self.history[ticker])
-                            
-                    except Exception as e:
-                        self.logger.error(f"Error processing {ticker}: {e}")
-                
-                time.sleep(CHECK_INTERVAL)
-                
-        except KeyboardInterrupt:
-            self.logger.info("Monitoring stopped by user")
+                # One batched request for all tickers per cycle, off the loop
+                all_data = await asyncio.to_thread(
+                    self.data_fetcher.fetch_bulk, STOCKS_TO_MONITOR)
+                await asyncio.gather(*(
+                    self.process_ticker(ticker, all_data.get(ticker))
+                    for ticker in STOCKS_TO_MONITOR
+                ))
+
+                await asyncio.sleep(CHECK_INTERVAL)
+
         except Exception as e:
             self.logger.error(f"Fatal error: {e}")
         finally:
@@ -93,4 +155,7 @@ class StockMonitor:
 
 if __name__ == "__main__":
     monitor = StockMonitor()
-    monitor.monitor()
\ No newline at end of file
+    try:
+        asyncio.run(monitor.monitor())
+    except KeyboardInterrupt:
+        logging.getLogger('stock_monitor').info("Monitoring stopped by user")
\ No newline at end of file
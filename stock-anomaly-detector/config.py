@@ -1,12 +0,0 @@
-# Configuration settings
-STOCKS_TO_MONITOR = ['AAPL', 'MSFT', 'GOOGL']
-ANOMALY_THRESHOLD = 2.5
-WINDOW_SIZE = 20
-CHECK_INTERVAL = 300  # 5 minutes in seconds
-
-# Alert settings
-ALERT_EMAILS = ['bhoompallyruthwik2411@gmail.com']
-SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587  # For TLS
-SMTP_USER = "bhoompallyruthwik2411@gmail.com"  # Your Gmail address
-SMTP_PASSWORD = "kggb xbfd xlrc awzr"  # (See Step 3)
\ No newline at end of file